@@ -16,6 +16,7 @@ from .collector import generate_policy
 from .diff import compute_policy_diff, fetch_inline_policy
 from .github import GitHubClient
 from .guardrails import enforce_guardrails
+from .http import get_session
 from .models import (
     PolicyDocument,
     PolicyGenerationRequest,
@@ -369,7 +370,7 @@ class AgentCoreTools:
                     "error": "GitHub token not configured",
                 }
 
-            client = GitHubClient(token=self.github_token)
+            client = GitHubClient(token=self.github_token, session=get_session())
             pr = client.create_pull_request(
                 repo=repo,
                 title=title,
@@ -2,15 +2,26 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Tuple
 
 import boto3
 from botocore.exceptions import ClientError
 
+from .aws import get_client
+from .cache import TTLCache
 from .models import ApprovalRecord
 
 LOGGER = logging.getLogger(__name__)
 
+# Recent `latest` results, keyed by (table_name, proposal_id).
+# Approval polling may be a couple of seconds stale; a record() from this
+# process drops the entry immediately.
+_latest_cache: TTLCache[Tuple[str, str], Optional[ApprovalRecord]] = TTLCache(
+    maxsize=256, ttl_seconds=2.0
+)
+# Distinguishes "not cached" from a cached None (no approval yet)
+_NOT_CACHED = object()
+
 
 class ApprovalStoreError(RuntimeError):
     """Raised when approval persistence fails."""
@@ -27,7 +38,7 @@ class ApprovalStore:
 
     def __init__(self, table_name: str, client: Optional[boto3.client] = None) -> None:
         self.table_name = table_name
-        self.client = client or boto3.client("dynamodb")
+        self.client = client or get_client("dynamodb")
 
     def record(self, proposal_id: str, approver: str, approved: bool, comments: str = "") -> None:
         record = ApprovalRecord(
@@ -49,12 +60,34 @@ class ApprovalStore:
             )
         except ClientError as err:
             raise ApprovalStoreError(f"Unable to record approval: {err}") from err
+        _latest_cache.pop((self.table_name, proposal_id))
         LOGGER.info("Recorded approval for %s by %s", proposal_id, approver)
 
-    def latest(self, proposal_id: str) -> Optional[ApprovalRecord]:
+    def latest(
+        self, proposal_id: str, consistent_read: bool = False
+    ) -> Optional[ApprovalRecord]:
+        """
+        Return the most recent approval for `proposal_id`, if any.
+
+        Polling callers should keep the default eventually-consistent read,
+        which costs half the read capacity. Pass consistent_read=True right
+        after a write that must be visible; that also bypasses the cache.
+        """
+        key = (self.table_name, proposal_id)
+        if not consistent_read:
+            cached = _latest_cache.get(key, _NOT_CACHED)
+            if cached is not _NOT_CACHED:
+                return cached
+
+        record = self._query_latest(proposal_id, consistent_read)
+        _latest_cache.set(key, record)
+        return record
+
+    def _query_latest(self, proposal_id: str, consistent_read: bool) -> Optional[ApprovalRecord]:
         try:
             response = self.client.query(
                 TableName=self.table_name,
+                ConsistentRead=consistent_read,
                 KeyConditionExpression="proposal_id = :proposal_id",
                 ExpressionAttributeValues={
                     ":proposal_id": {"S": proposal_id},
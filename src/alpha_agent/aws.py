@@ -0,0 +1,40 @@
+"""
+Shared boto3 session and client cache.
+
+Building a boto3 client loads service models and resolves credentials, which
+is slow enough to matter on CLI runs and warm Lambda invocations. Clients are
+created once per (service, region, config) and reused for the process.
+"""
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import boto3
+    from botocore.config import Config
+
+
+@functools.lru_cache(maxsize=None)
+def get_session() -> boto3.Session:
+    """Return the process-wide boto3 session."""
+    # Deferred: loading boto3 costs ~200 ms, which CLI paths that never
+    # reach AWS should not pay.
+    import boto3
+
+    return boto3.Session()
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(
+    service: str,
+    region: Optional[str] = None,
+    config: Optional[Config] = None,
+) -> boto3.client:
+    """
+    Return a cached client for `service`.
+
+    `config` is part of the cache key by identity, so pass module-level
+    Config constants rather than building one per call.
+    """
+    return get_session().client(service, region_name=region, config=config)
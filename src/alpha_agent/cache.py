@@ -0,0 +1,55 @@
+"""
+Small in-process cache shared by the AWS-facing modules.
+
+Entries expire after a fixed TTL and, once the cache is full, the oldest
+insertion is evicted. Every operation takes the cache's lock, so instances
+can live at module level and be used from worker threads.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded, thread-safe mapping whose entries expire after `ttl_seconds`."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[K, Tuple[float, V]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Return the value for `key` if present and not yet expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        return entry[1]
+
+    def get_stale(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Return the value for `key` even if it has expired, for revalidation."""
+        with self._lock:
+            entry = self._entries.get(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                # Evict the oldest insertion
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (expires_at, value)
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -6,6 +6,8 @@ Supports three modes: analyze, propose, apply.
 """
 from __future__ import annotations
 
+from types import MappingProxyType
+
 __version__ = "1.0.0"
 
 # Exit codes for CI/CD integration
@@ -14,9 +16,22 @@ EXIT_ERROR = 1            # Tool error (bad args, API failure, etc.)
 EXIT_RISKY = 2            # Analysis shows high risk (>10% break probability)
 EXIT_GUARDRAIL_VIOLATION = 3  # Guardrail constraints violated
 
-EXIT_CODE_DESCRIPTIONS = {
+EXIT_CODE_DESCRIPTIONS = MappingProxyType({
     EXIT_SUCCESS: "Success - safe to proceed",
     EXIT_ERROR: "Error - tool failure",
     EXIT_RISKY: "Risk detected - high break probability",
     EXIT_GUARDRAIL_VIOLATION: "Guardrail violation - policy blocked",
-}
+})
+
+# Exit codes are small and contiguous, so descriptions index a tuple directly
+_EXIT_DESCRIPTIONS_BY_CODE = tuple(
+    EXIT_CODE_DESCRIPTIONS.get(code, "Unknown error")
+    for code in range(max(EXIT_CODE_DESCRIPTIONS) + 1)
+)
+
+
+def describe_exit_code(exit_code: int) -> str:
+    """Return the human-readable description for an exit code."""
+    if 0 <= exit_code < len(_EXIT_DESCRIPTIONS_BY_CODE):
+        return _EXIT_DESCRIPTIONS_BY_CODE[exit_code]
+    return "Unknown error"
@@ -5,15 +5,15 @@ Analyzes IAM role usage and generates least-privilege policy proposal.
 """
 from __future__ import annotations
 
-import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 
 from alpha_agent.cli import EXIT_SUCCESS, EXIT_RISKY, EXIT_GUARDRAIL_VIOLATION, EXIT_ERROR
 from alpha_agent.cli.formatters import (
     format_terminal_summary,
-    format_json_proposal,
+    format_json_proposal_bytes,
     format_cloudformation_patch,
     format_terraform_patch,
 )
@@ -118,33 +118,42 @@ def run_analyze(
             access_role_name = os.getenv("ALPHA_ACCESS_ROLE_NAME", "AlphaAnalyzerRole")
             trail_name = os.getenv("ALPHA_TRAIL_NAME", "alpha-trail")
 
-            if fast_mode:
-                generated_policy = generate_policy_fast(
-                    role_arn=role_arn, usage_days=usage_days, region=region
-                )
-            else:
-                request = PolicyGenerationRequest(
-                    analyzer_arn=f"arn:aws:access-analyzer:{region}:{account_id}:analyzer/{analyzer_name}",
-                    resource_arn=role_arn,
-                    cloudtrail_access_role_arn=f"arn:aws:iam::{account_id}:role/{access_role_name}",
-                    cloudtrail_trail_arns=[f"arn:aws:cloudtrail:{region}:{account_id}:trail/{trail_name}"],
-                    usage_period_days=usage_days,
-                )
-
-                # Generate policy from CloudTrail via Access Analyzer
-                # Allow override via CLI or env var (ALPHA_ANALYZE_TIMEOUT_SECONDS)
-                effective_timeout = (
-                    timeout_seconds
-                    if timeout_seconds is not None
-                    else int(os.getenv("ALPHA_ANALYZE_TIMEOUT_SECONDS", "1800"))
+            # The existing policy is independent of generation; fetch it alongside
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                existing_future = (
+                    pool.submit(fetch_inline_policy, role_arn, baseline_policy_name)
+                    if baseline_policy_name
+                    else None
                 )
-                print(f"⏳ Waiting for Access Analyzer job (timeout {effective_timeout}s)\n")
-                generated_policy = generate_policy(request, timeout_seconds=effective_timeout)
 
-            # Get existing policy for diff
-            existing_policy = None
-            if baseline_policy_name:
-                existing_policy = fetch_inline_policy(role_arn, baseline_policy_name)
+                if fast_mode:
+                    generated_policy = generate_policy_fast(
+                        role_arn=role_arn, usage_days=usage_days, region=region
+                    )
+                else:
+                    request = PolicyGenerationRequest(
+                        analyzer_arn=f"arn:aws:access-analyzer:{region}:{account_id}:analyzer/{analyzer_name}",
+                        resource_arn=role_arn,
+                        cloudtrail_access_role_arn=f"arn:aws:iam::{account_id}:role/{access_role_name}",
+                        cloudtrail_trail_arns=[f"arn:aws:cloudtrail:{region}:{account_id}:trail/{trail_name}"],
+                        usage_period_days=usage_days,
+                    )
+
+                    # Generate policy from CloudTrail via Access Analyzer
+                    # Allow override via CLI or env var (ALPHA_ANALYZE_TIMEOUT_SECONDS)
+                    effective_timeout = (
+                        timeout_seconds
+                        if timeout_seconds is not None
+                        else int(os.getenv("ALPHA_ANALYZE_TIMEOUT_SECONDS", "1800"))
+                    )
+                    print(f"⏳ Waiting for Access Analyzer job (timeout {effective_timeout}s)\n")
+                    # Polled on this thread so Ctrl-C interrupts the wait directly
+                    generated_policy = generate_policy(
+                        request, timeout_seconds=effective_timeout
+                    )
+
+                # Get existing policy for diff
+                existing_policy = existing_future.result() if existing_future else None
 
             # Run Bedrock reasoning
             context = {
@@ -201,7 +210,7 @@ def run_analyze(
 
         # Save output if requested
         if output_path:
-            output_data = format_json_proposal(
+            output_data = format_json_proposal_bytes(
                 proposal,
                 diff,
                 metadata={
@@ -211,16 +220,17 @@ def run_analyze(
                     "mode": "mock" if mock_mode else "real",
                     "exit_code": exit_code,
                 },
+                indent=2,
             )
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(output_data, f, indent=2)
+            with open(output_path, "wb") as f:
+                f.write(output_data)
 
             print(f"\n✓ Proposal saved to: {output_path}")
 
         # Save CloudFormation patch if requested
         if output_cloudformation:
-            role_name = role_arn.split("/")[-1]
+            role_name = role_arn.rpartition("/")[2]
             cfn_patch = format_cloudformation_patch(role_name, proposal)
 
             with open(output_cloudformation, "w", encoding="utf-8") as f:
@@ -230,7 +240,7 @@ def run_analyze(
 
         # Save Terraform patch if requested
         if output_terraform:
-            role_name = role_arn.split("/")[-1]
+            role_name = role_arn.rpartition("/")[2]
             tf_patch = format_terraform_patch(role_name, proposal)
 
             with open(output_terraform, "w", encoding="utf-8") as f:
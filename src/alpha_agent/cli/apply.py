@@ -15,7 +15,7 @@ from botocore.exceptions import ClientError
 from alpha_agent.cli import EXIT_SUCCESS, EXIT_ERROR
 from alpha_agent.cli.mock_mode import MockModeProvider
 from alpha_agent.approvals import ApprovalStore
-from alpha_agent.models import PolicyProposal
+from alpha_agent.models import ProposalEnvelope
 
 LOGGER = logging.getLogger(__name__)
 
@@ -40,11 +40,11 @@ def run_apply(
 
     try:
         # Load proposal from file
-        with open(proposal_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(proposal_path, "rb") as f:
+            envelope = ProposalEnvelope.model_validate_json(f.read())
 
-        proposal = PolicyProposal(**data["proposal"])
-        metadata = data.get("metadata", {})
+        proposal = envelope.proposal
+        metadata = envelope.metadata
         role_arn = metadata.get("role_arn") or metadata.get("roleArn") or "unknown-role"
 
         # Check approval if required
@@ -5,13 +5,17 @@ Compares a proposal against the current live state of an IAM role.
 """
 from __future__ import annotations
 
-import json
 import logging
 
 from alpha_agent.cli import EXIT_SUCCESS, EXIT_ERROR
-from alpha_agent.cli.formatters import Colors, format_terminal_summary
+from alpha_agent.cli.formatters import (
+    ADDED_ACTION_FMT,
+    REMOVED_ACTION_FMT,
+    Colors,
+    format_terminal_summary,
+)
 from alpha_agent.diff import compute_policy_diff, fetch_all_role_policies
-from alpha_agent.models import PolicyProposal
+from alpha_agent.models import ProposalEnvelope
 
 LOGGER = logging.getLogger(__name__)
 
@@ -26,11 +30,11 @@ def run_diff(
     """
     try:
         # Load proposal
-        with open(proposal_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(proposal_path, "rb") as f:
+            envelope = ProposalEnvelope.model_validate_json(f.read())
         
-        proposal = PolicyProposal(**data["proposal"])
-        metadata = data.get("metadata", {})
+        proposal = envelope.proposal
+        metadata = envelope.metadata
         target_role = role_arn or metadata.get("role_arn") or metadata.get("roleArn")
 
         if not target_role:
@@ -60,10 +64,9 @@ def run_diff(
         # Print detailed diff
         if diff.added_actions or diff.removed_actions:
             print(f"{Colors.BOLD}Detailed Action Diff:{Colors.END}")
-            for action in diff.added_actions:
-                print(f"  {Colors.GREEN}+ {action}{Colors.END}")
-            for action in diff.removed_actions:
-                print(f"  {Colors.RED}- {action}{Colors.END}")
+            lines = [ADDED_ACTION_FMT.format(action) for action in diff.added_actions]
+            lines.extend(REMOVED_ACTION_FMT.format(action) for action in diff.removed_actions)
+            print("\n".join(lines))
             print("")
         else:
             print(f"✨ {Colors.GREEN}No action-level differences detected between proposal and live role.{Colors.END}\n")
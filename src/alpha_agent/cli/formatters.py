@@ -10,6 +10,8 @@ Converts policy proposals into various formats:
 from __future__ import annotations
 
 import json
+import os
+import warnings
 from typing import Any, Dict, List
 
 from alpha_agent.models import PolicyDiff, PolicyDocument, PolicyProposal
@@ -28,6 +30,16 @@ class Colors:
     END = "\033[0m"
 
 
+# https://no-color.org: any non-empty NO_COLOR disables ANSI output
+if os.getenv("NO_COLOR"):
+    for _name in ("HEADER", "BLUE", "CYAN", "GREEN", "YELLOW", "RED", "BOLD", "UNDERLINE", "END"):
+        setattr(Colors, _name, "")
+
+# Precomputed per-action line templates, filled with str.format
+ADDED_ACTION_FMT = f"  {Colors.GREEN}+ {{}}{Colors.END}"
+REMOVED_ACTION_FMT = f"  {Colors.RED}- {{}}{Colors.END}"
+
+
 def format_terminal_summary(
     proposal: PolicyProposal,
     diff: PolicyDiff | None = None,
@@ -55,21 +67,20 @@ def format_terminal_summary(
 
     # Policy Changes
     if diff:
-        total_before = len(diff.removed_actions) + len(diff.added_actions) # Approximation
-        reduction_pct = (len(diff.removed_actions) / max(len(diff.removed_actions) + len(diff.added_actions), 1)) * 100
-        
+        added_count = len(diff.added_actions)
+        removed_count = len(diff.removed_actions)
+
         lines.append(f"{Colors.BOLD}Policy Change Summary{Colors.END}")
-        lines.append(f"  {Colors.GREEN}󰄬 Added{Colors.END}:    {len(diff.added_actions):>3} actions")
-        lines.append(f"  {Colors.RED}󰅙 Removed{Colors.END}:  {len(diff.removed_actions):>3} actions")
-        lines.append(f"  {Colors.CYAN}󱕊 Reduction{Colors.END}: {Colors.BOLD}{reduction_pct:.1f}%{Colors.END}")
+        lines.append(f"  {Colors.GREEN}󰄬 Added{Colors.END}:    {added_count:>3} actions")
+        lines.append(f"  {Colors.RED}󰅙 Removed{Colors.END}:  {removed_count:>3} actions")
+        lines.append(f"  {Colors.CYAN}󱕊 Reduction{Colors.END}: {Colors.BOLD}{diff.reduction_pct:.1f}%{Colors.END}")
         lines.append("")
 
         if diff.added_actions:
             lines.append(f"{Colors.BOLD}Top Added Actions:{Colors.END}")
-            for action in diff.added_actions[:5]:
-                lines.append(f"  {Colors.GREEN}+ {action}{Colors.END}")
-            if len(diff.added_actions) > 5:
-                lines.append(f"    ... and {len(diff.added_actions) - 5} more")
+            lines.extend(map(ADDED_ACTION_FMT.format, diff.added_actions[:5]))
+            if added_count > 5:
+                lines.append(f"    ... and {added_count - 5} more")
             lines.append("")
 
     # Guardrail Violations
@@ -107,13 +118,14 @@ def format_pr_comment(
     Returns markdown with metrics, diff, and approval checklist.
     """
     risk_pct = proposal.risk_signal.probability_of_break * 100
-    reduction_pct = (len(diff.removed_actions) / max(len(diff.removed_actions) + len(diff.added_actions), 1)) * 100
+    added_count = len(diff.added_actions)
+    removed_count = len(diff.removed_actions)
 
     lines = [
         "## 🔒 ALPHA Policy Analysis",
         "",
         f"**Role**: `{role_name}`",
-        f"**Privilege Reduction**: **{reduction_pct:.1f}%** ({len(diff.removed_actions)} → {len(diff.added_actions)} actions)",
+        f"**Privilege Reduction**: **{diff.reduction_pct:.1f}%** ({removed_count} → {added_count} actions)",
         "",
         "### Risk Assessment",
         f"- **Breakage Probability**: {risk_pct:.1f}%",
@@ -128,8 +140,8 @@ def format_pr_comment(
         lines.append("#### ✅ Added Actions")
         for action in diff.added_actions[:10]:  # First 10
             lines.append(f"- `{action}`")
-        if len(diff.added_actions) > 10:
-            lines.append(f"- ... and {len(diff.added_actions) - 10} more")
+        if added_count > 10:
+            lines.append(f"- ... and {added_count - 10} more")
         lines.append("")
 
     # Removed actions
@@ -137,8 +149,8 @@ def format_pr_comment(
         lines.append("#### ❌ Removed Actions")
         for action in diff.removed_actions[:10]:
             lines.append(f"- `{action}`")
-        if len(diff.removed_actions) > 10:
-            lines.append(f"- ... and {len(diff.removed_actions) - 10} more")
+        if removed_count > 10:
+            lines.append(f"- ... and {removed_count - 10} more")
         lines.append("")
 
     # Guardrails
@@ -254,7 +266,15 @@ def format_json_proposal(
     Format proposal as structured JSON for machine consumption.
 
     Includes all metadata, diff, and audit information.
+
+    Deprecated: use ``format_json_proposal_bytes`` when the result is only
+    going to be written out as JSON.
     """
+    warnings.warn(
+        "format_json_proposal is deprecated; use format_json_proposal_bytes",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     output = {
         "version": "1.0",
         "proposal": proposal.model_dump(mode="json", by_alias=True),
@@ -267,3 +287,39 @@ def format_json_proposal(
         output["metadata"] = metadata
 
     return output
+
+
+def format_json_proposal_bytes(
+    proposal: PolicyProposal,
+    diff: PolicyDiff | None = None,
+    metadata: Dict[str, Any] | None = None,
+    indent: int | None = None,
+) -> bytes:
+    """
+    Format proposal as encoded JSON, same layout as ``format_json_proposal``.
+
+    The proposal and diff are serialized by pydantic-core straight to JSON and
+    spliced into the envelope, skipping the intermediate Python dicts.
+    """
+    fields = {
+        "version": json.dumps("1.0"),
+        "proposal": proposal.model_dump_json(by_alias=True, indent=indent),
+    }
+
+    if diff:
+        fields["diff"] = diff.model_dump_json(by_alias=True, indent=indent)
+
+    if metadata:
+        fields["metadata"] = json.dumps(metadata, indent=indent)
+
+    if indent is None:
+        body = ",".join(f'"{key}":{value}' for key, value in fields.items())
+        return f"{{{body}}}".encode("utf-8")
+
+    # JSON strings never contain raw newlines, so nesting one level deeper
+    # only needs each line break re-padded.
+    pad = "\n" + " " * indent
+    body = ",".join(
+        f'{pad}"{key}": {value.replace(chr(10), pad)}' for key, value in fields.items()
+    )
+    return f"{{{body}\n}}".encode("utf-8")
@@ -27,7 +27,8 @@ MOCK_CLOUDTRAIL_ACTIVITY = {
     "logs:CreateLogStream": 24,
 }
 
-MOCK_CURRENT_POLICY = PolicyDocument(
+# Mock constants are known-good, so skip validation when building them
+MOCK_CURRENT_POLICY = PolicyDocument.model_construct(
     version="2012-10-17",
     statement=[
         {
@@ -38,7 +39,7 @@ MOCK_CURRENT_POLICY = PolicyDocument(
     ],
 )
 
-MOCK_PROPOSED_POLICY = PolicyDocument(
+MOCK_PROPOSED_POLICY = PolicyDocument.model_construct(
     version="2012-10-17",
     statement=[
         {
@@ -120,7 +121,7 @@ class MockModeProvider:
         """
         LOGGER.info("MOCK MODE: Simulating Bedrock reasoning")
 
-        return PolicyProposal(
+        return PolicyProposal.model_construct(
             proposed_policy=MOCK_PROPOSED_POLICY.model_copy(deep=True),
             rationale=(
                 "Based on 30 days of CloudTrail analysis (1,245 datapoints), this role "
@@ -129,7 +130,7 @@ class MockModeProvider:
                 "The proposed policy scopes permissions to specific ARNs and adds organizational "
                 "boundary conditions to prevent cross-org access."
             ),
-            risk_signal=RiskSignal(
+            risk_signal=RiskSignal.model_construct(
                 probability_of_break=0.05,
                 rationale=(
                     "High confidence assessment based on comprehensive telemetry. "
@@ -0,0 +1,371 @@
+"""
+Argument parsers for the alpha CLI.
+
+Each subcommand's options are defined by an add_<command>_arguments
+function so entrypoints can compose only the subcommands they need.
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+from typing import List, Optional
+
+
+# Help text shared by several subcommands
+_MOCK_DATA_HELP = "Use deterministic mock data"
+_STATE_MACHINE_HELP = "Step Functions state machine ARN"
+_PROPOSAL_PATH_HELP = "Path to proposal JSON from analyze command"
+_DRY_RUN_HELP = "Show what would be done without executing"
+
+
+def _comma_list(value: str) -> List[str]:
+    """Split a comma-separated argument into trimmed, non-empty items."""
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def add_analyze_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--role-arn",
+        required=True,
+        help="IAM role ARN to analyze (e.g., arn:aws:iam::123:role/MyRole)",
+    )
+
+    parser.add_argument(
+        "--usage-days",
+        type=int,
+        default=30,
+        help="Number of days of CloudTrail activity to analyze (default: 30)",
+    )
+
+    parser.add_argument(
+        "--output",
+        help="Path to save proposal JSON (e.g., proposal.json)",
+    )
+
+    parser.add_argument(
+        "--guardrails",
+        choices=["none", "sandbox", "prod"],
+        default="prod",
+        help="Guardrail preset to apply (default: prod)",
+    )
+
+    parser.add_argument(
+        "--baseline-policy-name",
+        help="Existing inline policy name to diff against",
+    )
+
+    parser.add_argument(
+        "--exclude-services",
+        type=_comma_list,
+        help="Comma-separated list of services to exclude (e.g., ec2,iam)",
+    )
+
+    parser.add_argument(
+        "--suppress-actions",
+        type=_comma_list,
+        help="Comma-separated list of actions to suppress (e.g., s3:DeleteBucket)",
+    )
+
+    parser.add_argument(
+        "--mock-mode",
+        action="store_true",
+        help="Use deterministic mock data for offline demo (no AWS calls)",
+    )
+
+    parser.add_argument(
+        "--output-cloudformation",
+        help="Path to save CloudFormation YAML patch (e.g., cfn-patch.yml)",
+    )
+
+    parser.add_argument(
+        "--output-terraform",
+        help="Path to save Terraform HCL patch (e.g., tf-patch.tf)",
+    )
+
+    parser.add_argument(
+        "--timeout-seconds",
+        type=int,
+        help="Max seconds to wait for Access Analyzer job (default: 1800 or ALPHA_ANALYZE_TIMEOUT_SECONDS)",
+    )
+
+    parser.add_argument(
+        "--fast",
+        dest="fast",
+        action="store_true",
+        default=True,
+        help="Fast mode (default): use CloudTrail Event History (no Access Analyzer)",
+    )
+    parser.add_argument(
+        "--no-fast",
+        dest="fast",
+        action="store_false",
+        help="Disable fast mode; use Access Analyzer",
+    )
+
+    parser.add_argument(
+        "--bedrock-model",
+        dest="bedrock_model",
+        help="Override Bedrock model ID (e.g., us.amazon.nova-pro-v1:0). Defaults to ALPHA_BEDROCK_MODEL_ID or Anthropic Sonnet.",
+    )
+
+
+def add_propose_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--repo",
+        required=True,
+        help="GitHub repository (e.g., owner/repo)",
+    )
+
+    parser.add_argument(
+        "--branch",
+        required=True,
+        help="Branch name for the PR (e.g., harden/ci-runner-2025-10-18)",
+    )
+
+    parser.add_argument(
+        "--input",
+        required=True,
+        help=_PROPOSAL_PATH_HELP,
+    )
+
+    parser.add_argument(
+        "--base",
+        default="main",
+        help="Base branch for PR (default: main)",
+    )
+
+    parser.add_argument(
+        "--title",
+        help="Custom PR title (auto-generated if not provided)",
+    )
+
+    parser.add_argument(
+        "--draft",
+        action="store_true",
+        help="Create as draft PR",
+    )
+
+    parser.add_argument(
+        "--github-token",
+        help="GitHub personal access token (or set GITHUB_TOKEN env var)",
+    )
+
+
+def add_apply_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--state-machine-arn",
+        required=True,
+        help=_STATE_MACHINE_HELP,
+    )
+
+    parser.add_argument(
+        "--proposal",
+        required=True,
+        help=_PROPOSAL_PATH_HELP,
+    )
+
+    parser.add_argument(
+        "--environment",
+        choices=["sandbox", "canary", "prod"],
+        default="prod",
+        help="Target environment (default: prod)",
+    )
+
+    parser.add_argument(
+        "--canary",
+        type=int,
+        default=10,
+        help="Canary rollout percentage (default: 10)",
+    )
+
+    parser.add_argument(
+        "--rollback-threshold",
+        default="AccessDenied>0.1%",
+        help="Rollback threshold expression (default: AccessDenied>0.1%%)",
+    )
+
+    parser.add_argument(
+        "--require-approval",
+        action="store_true",
+        help="Require human approval before rollout",
+    )
+
+    parser.add_argument(
+        "--approval-table",
+        help="DynamoDB table name for approvals (required if --require-approval)",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help=_DRY_RUN_HELP,
+    )
+
+    parser.add_argument(
+        "--mock-mode",
+        action="store_true",
+        help="Use deterministic mock execution (no AWS calls)",
+    )
+
+
+def add_diff_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--input",
+        required=True,
+        help=_PROPOSAL_PATH_HELP,
+    )
+
+    parser.add_argument(
+        "--role-arn",
+        help="Optional role ARN (overrides ARN in proposal)",
+    )
+
+    parser.add_argument(
+        "--mock-mode",
+        action="store_true",
+        help=_MOCK_DATA_HELP,
+    )
+
+
+def add_status_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--role-arn",
+        required=True,
+        help="IAM role ARN to check",
+    )
+
+    parser.add_argument(
+        "--state-machine-arn",
+        required=True,
+        help=_STATE_MACHINE_HELP,
+    )
+
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=5,
+        help="Number of recent rollouts to show (default: 5)",
+    )
+
+    parser.add_argument(
+        "--mock-mode",
+        action="store_true",
+        help=_MOCK_DATA_HELP,
+    )
+
+
+def add_rollback_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--proposal",
+        help="Optional path to proposal JSON that should be reverted",
+    )
+
+    parser.add_argument(
+        "--role-arn",
+        help="Optional Role ARN to rollback (will lookup history if --proposal is missing)",
+    )
+
+    parser.add_argument(
+        "--state-machine-arn",
+        required=True,
+        help=_STATE_MACHINE_HELP,
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help=_DRY_RUN_HELP,
+    )
+
+    parser.add_argument(
+        "--mock-mode",
+        action="store_true",
+        help="Use deterministic mock execution",
+    )
+
+
+def add_audit_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=10,
+        help="Number of top over-privileged roles to show (default: 10)",
+    )
+
+    parser.add_argument(
+        "--usage-days",
+        type=int,
+        default=30,
+        help="Window for CloudTrail analysis (default: 30)",
+    )
+
+    parser.add_argument(
+        "--mock-mode",
+        action="store_true",
+        help=_MOCK_DATA_HELP,
+    )
+
+
+# Subcommand name -> (help text, argument builder). Only the invoked
+# subcommand gets its arguments added; see build_parser.
+SUBPARSER_BUILDERS = {
+    "analyze": (
+        "Analyze IAM role usage and generate least-privilege policy",
+        add_analyze_arguments,
+    ),
+    "propose": (
+        "Create GitHub pull request with policy proposal",
+        add_propose_arguments,
+    ),
+    "apply": (
+        "Execute staged rollout via Step Functions",
+        add_apply_arguments,
+    ),
+    "diff": (
+        "Compare proposal against current live role state",
+        add_diff_arguments,
+    ),
+    "status": (
+        "Check status of recent policy rollouts for a role",
+        add_status_arguments,
+    ),
+    "rollback": (
+        "Emergency rollback to original policy state",
+        add_rollback_arguments,
+    ),
+    "audit": (
+        "Scan account and identify most over-privileged roles",
+        add_audit_arguments,
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser.
+
+    Every subcommand is registered so top-level --help still lists them,
+    but only `command` (the first CLI token) has its options added. Pass
+    None to build the full tree.
+    """
+    parser = argparse.ArgumentParser(
+        prog="alpha",
+        description="ALPHA - Autonomous Least-Privilege Hardening Agent",
+        epilog="See https://github.com/your-org/alpha for full documentation",
+    )
+
+    parser.add_argument(
+        "--version",
+        action="version",
+        version="%(prog)s 1.0.0",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True, help="Command to run")
+
+    for name, (help_text, add_arguments) in SUBPARSER_BUILDERS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if command is None or command == name:
+            add_arguments(subparser)
+
+    return parser
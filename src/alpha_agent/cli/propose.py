@@ -12,7 +12,7 @@ from typing import Dict
 from alpha_agent.cli import EXIT_SUCCESS, EXIT_ERROR
 from alpha_agent.cli.formatters import format_pr_comment
 from alpha_agent.github import GitHubClient, GitHubError
-from alpha_agent.models import PolicyDiff, PolicyProposal
+from alpha_agent.models import ProposalEnvelope
 
 LOGGER = logging.getLogger(__name__)
 
@@ -35,24 +35,19 @@ def run_propose(
 
     try:
         # Load proposal from file
-        with open(input_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(input_path, "rb") as f:
+            envelope = ProposalEnvelope.model_validate_json(f.read())
 
-        # Parse proposal and diff
-        proposal = PolicyProposal(**data["proposal"])
-        diff_data = data.get("diff")
-        diff = PolicyDiff(**diff_data) if diff_data else None
+        proposal = envelope.proposal
+        diff = envelope.diff
 
         # Extract role name from metadata
-        role_arn = data.get("metadata", {}).get("role_arn", "unknown-role")
-        role_name = role_arn.split("/")[-1]
+        role_arn = envelope.metadata.get("role_arn", "unknown-role")
+        role_name = role_arn.rpartition("/")[2] or "unknown-role"
 
         # Generate PR title if not provided
         if not title:
-            reduction_pct = 0
-            if diff:
-                total = len(diff.added_actions) + len(diff.removed_actions)
-                reduction_pct = (len(diff.removed_actions) / max(total, 1)) * 100
+            reduction_pct = diff.reduction_pct if diff else 0
             title = f"ALPHA: Harden {role_name} ({reduction_pct:.0f}% privilege reduction)"
 
         # Generate PR body
@@ -72,10 +67,15 @@ def run_propose(
 
         client = GitHubClient(token=token)
 
-        # Create PR
-        print(f"\n📝 Creating PR in {repo}...")
-        print(f"   Branch: {branch} → {base}")
-        print(f"   Title: {title}")
+        # Create PR (flushed before the API call so the user sees progress)
+        print(
+            "\n".join([
+                f"\n📝 Creating PR in {repo}...",
+                f"   Branch: {branch} → {base}",
+                f"   Title: {title}",
+            ]),
+            flush=True,
+        )
 
         pr = client.create_pull_request(
             repo=repo,
@@ -89,9 +89,11 @@ def run_propose(
         pr_url = pr.get("html_url", "")
         pr_number = pr.get("number", "")
 
-        print(f"\n✓ Pull request created successfully!")
-        print(f"   URL: {pr_url}")
-        print(f"   Number: #{pr_number}")
+        print("\n".join([
+            "\n✓ Pull request created successfully!",
+            f"   URL: {pr_url}",
+            f"   Number: #{pr_number}",
+        ]))
 
         return EXIT_SUCCESS
 
@@ -102,8 +104,7 @@ def run_propose(
 
     except FileNotFoundError as err:
         LOGGER.error("Input file not found: %s", err)
-        print(f"\n❌ File not found: {err}")
-        print(f"   Did you run 'alpha analyze' first?")
+        print(f"\n❌ File not found: {err}\n   Did you run 'alpha analyze' first?")
         return EXIT_ERROR
 
     except Exception as err:
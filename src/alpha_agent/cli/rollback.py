@@ -29,8 +29,9 @@ def run_rollback(
     Can use a proposal file or look up history via Step Functions.
     """
     try:
-        print(f"\n⏪ {Colors.BOLD}{Colors.RED}Initiating Rollback{Colors.END}")
-        
+        # Progress lines are buffered and flushed once per phase
+        lines = [f"\n⏪ {Colors.BOLD}{Colors.RED}Initiating Rollback{Colors.END}"]
+
         original_policy = None
         metadata = {}
         target_role = role_arn
@@ -44,29 +45,33 @@ def run_rollback(
                 original_policy = diff["existing_policy"]
                 metadata = data.get("metadata", {})
                 target_role = target_role or metadata.get("role_arn") or metadata.get("roleArn")
-                print(f"   Using original policy from file: {proposal_path}")
+                lines.append(f"   Using original policy from file: {proposal_path}")
             else:
-                print(f"⚠️  No 'existing_policy' found in {proposal_path}")
+                lines.append(f"⚠️  No 'existing_policy' found in {proposal_path}")
 
         # 2. Try to get from history if still missing
         if not original_policy and target_role:
             if mock_mode:
-                print(f"🎭 {Colors.CYAN}Mock Mode: Simulating history lookup...{Colors.END}")
+                lines.append(f"🎭 {Colors.CYAN}Mock Mode: Simulating history lookup...{Colors.END}")
                 original_policy = {"Version": "2012-10-17", "Statement": [{"Effect": "Allow", "Action": "*", "Resource": "*"}]}
             else:
-                print(f"🔍 Searching execution history for {target_role}...")
+                lines.append(f"🔍 Searching execution history for {target_role}...")
+                print("\n".join(lines), flush=True)
+                lines = []
                 original_policy = _find_original_policy_from_history(state_machine_arn, target_role)
 
         if not original_policy:
-            print(f"❌ Error: Could not find original policy for rollback.")
-            print(f"   Provide a valid --proposal file or a --role-arn with recent ALPHA activity.")
+            lines.append(f"❌ Error: Could not find original policy for rollback.")
+            lines.append(f"   Provide a valid --proposal file or a --role-arn with recent ALPHA activity.")
+            print("\n".join(lines))
             return EXIT_ERROR
 
         if not target_role:
-            print(f"❌ Error: Target Role ARN unknown.")
+            lines.append(f"❌ Error: Target Role ARN unknown.")
+            print("\n".join(lines))
             return EXIT_ERROR
 
-        print(f"   Target Role: {target_role}")
+        lines.append(f"   Target Role: {target_role}")
 
         # Construct a "rollback proposal"
         rollback_proposal = {
@@ -96,7 +101,8 @@ def run_rollback(
             tmp_path = tmp.name
 
         try:
-            print(f"🚀 {Colors.BOLD}Triggering rollback rollout (100% skip-canary)...{Colors.END}")
+            lines.append(f"🚀 {Colors.BOLD}Triggering rollback rollout (100% skip-canary)...{Colors.END}")
+            print("\n".join(lines), flush=True)
             return run_apply(
                 state_machine_arn=state_machine_arn,
                 proposal_path=tmp_path,
@@ -5,17 +5,34 @@ Checks the status of recent policy rollouts for a given role.
 """
 from __future__ import annotations
 
+import json
 import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Tuple
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from alpha_agent.aws import get_client
 from alpha_agent.cli import EXIT_SUCCESS, EXIT_ERROR
 from alpha_agent.cli.formatters import Colors
 
 LOGGER = logging.getLogger(__name__)
 
+# describe_execution fan-out; batches stay small so we stop soon after `limit`
+_DESCRIBE_WORKERS = 8
+_DESCRIBE_BATCH = _DESCRIBE_WORKERS * 2
+_SFN_CONFIG = Config(max_pool_connections=16)
+# Executions scanned per requested result, with a floor for small limits
+_SCAN_PER_RESULT = 20
+_MIN_SCAN = 200
+
+
+def _build_sfn_client() -> boto3.client:
+    return get_client("stepfunctions", config=_SFN_CONFIG)
+
 
 def run_status(
     role_arn: str,
@@ -40,59 +57,46 @@ def run_status(
         return EXIT_SUCCESS
 
     try:
-        sfn = boto3.client("stepfunctions")
+        sfn = _build_sfn_client()
 
         # List executions for the state machine
         # Note: Step Functions doesn't support server-side filtering by input content easily
-        # so we list and filter client-side for the recent ones.
+        # so we list and filter client-side, bounding how many executions we scan.
         paginator = sfn.get_paginator("list_executions")
         response_iterator = paginator.paginate(
             stateMachineArn=state_machine_arn,
-            maxResults=100,  # Look at last 100 executions
+            PaginationConfig={
+                "PageSize": 1000,
+                "MaxItems": max(limit * _SCAN_PER_RESULT, _MIN_SCAN),
+            },
         )
 
         found = 0
         print(f"{'Execution ID':<40} {'Status':<15} {'Environment':<12} {'Started':<20}")
         print("-" * 90)
 
-        for page in response_iterator:
-            for execution in page["executions"]:
-                # We need to describe the execution to see the input (to match role_arn)
-                # This might be slow if there are many executions, but okay for a status command.
-                desc = sfn.describe_execution(executionArn=execution["executionArn"])
-                input_data = desc.get("input", "{}")
-                try:
-                    input_json = desc.get("input_json") or {} # handle possible pre-parsed
-                    if not input_json:
-                        import json
-                        input_json = json.loads(input_data)
-                    
-                    target_role = input_json.get("roleArn") or input_json.get("role_arn")
-                    
-                    if target_role == role_arn:
-                        status = execution["status"]
-                        status_color = _get_status_color(status)
-                        
-                        env = input_json.get("environment", "unknown")
-                        canary = input_json.get("canaryPercent", "N/A")
-                        if canary != "N/A":
-                            canary = f"{canary}%"
-                            
-                        print(
-                            f"{execution['name']:<40} "
-                            f"{status_color}{status:<15}{Colors.END} "
-                            f"{env:<12} "
-                            f"{execution['startDate'].strftime('%Y-%m-%d %H:%M'):<20}"
-                        )
-                        
-                        found += 1
-                        if found >= limit:
-                            break
-                except Exception:
-                    continue
-            
-            if found >= limit:
-                break
+        with ThreadPoolExecutor(max_workers=_DESCRIBE_WORKERS) as pool:
+            matches = _iter_role_executions(sfn, response_iterator, role_arn, pool)
+            for execution, input_json in matches:
+                status = execution["status"]
+                status_color = _get_status_color(status)
+
+                # Inputs are caller-supplied; a null or non-string field must
+                # not abort the listing
+                env = str(input_json.get("environment") or "unknown")
+                canary = input_json.get("canaryPercent")
+                canary = "N/A" if canary is None else f"{canary}%"
+
+                print(
+                    f"{execution['name']:<40} "
+                    f"{status_color}{status:<15}{Colors.END} "
+                    f"{env:<12} "
+                    f"{execution['startDate'].strftime('%Y-%m-%d %H:%M'):<20}"
+                )
+
+                found += 1
+                if found >= limit:
+                    break
 
         if found == 0:
             print(f"\nℹ️  No recent rollouts found for this role in {state_machine_arn}")
@@ -109,6 +113,41 @@ def run_status(
         return EXIT_ERROR
 
 
+def _describe_input(sfn: boto3.client, execution_arn: str) -> Dict[str, Any]:
+    """Return the parsed input of an execution, or {} if it is not JSON."""
+    desc = sfn.describe_execution(executionArn=execution_arn)
+    try:
+        input_json = json.loads(desc.get("input") or "{}")
+    except ValueError:
+        return {}
+    return input_json if isinstance(input_json, dict) else {}
+
+
+def _iter_role_executions(
+    sfn: boto3.client,
+    pages: Iterable[Dict[str, Any]],
+    role_arn: str,
+    pool: Executor,
+) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """
+    Yield (execution, input) pairs whose input targets `role_arn`, newest first.
+
+    Executions are described in small parallel batches so the caller can stop
+    consuming once it has enough matches without paying for the whole page.
+    """
+    for page in pages:
+        executions = page["executions"]
+        for offset in range(0, len(executions), _DESCRIBE_BATCH):
+            batch = executions[offset:offset + _DESCRIBE_BATCH]
+            inputs = pool.map(
+                lambda execution: _describe_input(sfn, execution["executionArn"]), batch
+            )
+            for execution, input_json in zip(batch, inputs):
+                target_role = input_json.get("roleArn") or input_json.get("role_arn")
+                if target_role == role_arn:
+                    yield execution, input_json
+
+
 def _get_status_color(status: str) -> str:
     if status == "SUCCEEDED":
         return Colors.GREEN
@@ -2,24 +2,34 @@ from __future__ import annotations
 
 import json
 import logging
+import random
+import threading
 import time
+from concurrent.futures import Executor, Future
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional
 
 import boto3
 from botocore.exceptions import ClientError
 
+from .aws import get_client
 from .models import PolicyDocument, PolicyGenerationRequest
 
 LOGGER = logging.getLogger(__name__)
 
+# Short jobs are polled quickly; after the fast window the delay grows
+# exponentially up to the caller's poll_interval.
+_FAST_POLL_SECONDS = 2.0
+_FAST_POLL_WINDOW_SECONDS = 30.0
+_POLL_BACKOFF_FACTOR = 1.5
+
 
 class PolicyGenerationError(RuntimeError):
     """Raised when IAM Access Analyzer policy generation fails."""
 
 
-def _build_access_analyzer_client() -> boto3.client:
-    return boto3.client("accessanalyzer")
+def _build_access_analyzer_client(region: Optional[str] = None) -> boto3.client:
+    return get_client("accessanalyzer", region)
 
 
 def start_policy_generation(
@@ -32,13 +42,13 @@ def start_policy_generation(
     """
     client = client or _build_access_analyzer_client()
     try:
-        start_time = datetime.now(timezone.utc) - timedelta(days=request.usage_period_days)
         end_time = datetime.now(timezone.utc)
+        start_time = end_time - timedelta(days=request.usage_period_days)
         # AWS requires datetime in specific format: yyyy-MM-dd'T'HH:mm:ss.SSSZ
-        start_time_str = start_time.strftime('%Y-%m-%dT%H:%M:%S') + '.000Z'
-        end_time_str = end_time.strftime('%Y-%m-%dT%H:%M:%S') + '.000Z'
+        start_time_str = f"{start_time:%Y-%m-%dT%H:%M:%S}.000Z"
+        end_time_str = f"{end_time:%Y-%m-%dT%H:%M:%S}.000Z"
         response = client.start_policy_generation(
-            clientToken=f"{request.resource_arn}:{int(time.time())}",
+            clientToken=f"{request.resource_arn}:{time.time_ns() // 1_000_000_000}",
             cloudTrailDetails={
                 "accessRole": request.cloudtrail_access_role_arn,
                 "endTime": end_time_str,
@@ -63,19 +73,29 @@ def start_policy_generation(
 def wait_for_policy_json(
     job_id: str,
     client: Optional[boto3.client] = None,
-    poll_interval: int = 10,
+    poll_interval: int = 30,
     timeout_seconds: int = 1800,
+    cancel: Optional[threading.Event] = None,
 ) -> Dict:
     """
     Poll for job completion and return the generated policy JSON.
 
+    Polls every couple of seconds for the first half minute, then backs off
+    exponentially (with jitter) up to `poll_interval` seconds between calls.
+    Setting `cancel` stops the wait promptly with PolicyGenerationError.
+
     The Access Analyzer API returns a JSON document as a string; this function
     deserializes it before returning.
     """
     client = client or _build_access_analyzer_client()
-    started = time.time()
+    started = time.monotonic()
+    deadline = started + timeout_seconds
+    attempt = 0
 
     while True:
+        if cancel is not None and cancel.is_set():
+            raise PolicyGenerationError(f"Wait for policy generation job {job_id} cancelled")
+
         try:
             response = client.get_generated_policy(jobId=job_id)
         except ClientError as err:
@@ -94,19 +114,40 @@ def wait_for_policy_json(
                 f"Policy generation job {job_id} failed: {reason}"
             )
 
-        if time.time() - started > timeout_seconds:
+        now = time.monotonic()
+        if now > deadline:
             raise PolicyGenerationError(
                 f"Policy generation job {job_id} timed out after {timeout_seconds}s"
             )
 
-        LOGGER.debug("Job %s still running, sleeping %s seconds", job_id, poll_interval)
-        time.sleep(poll_interval)
+        if now - started < _FAST_POLL_WINDOW_SECONDS:
+            delay = _FAST_POLL_SECONDS
+        else:
+            attempt += 1
+            delay = min(poll_interval, _FAST_POLL_SECONDS * _POLL_BACKOFF_FACTOR ** attempt)
+        delay = min(delay + random.uniform(0, delay / 10), max(deadline - now, 0))
+
+        LOGGER.debug("Job %s still running, sleeping %.1f seconds", job_id, delay)
+        if cancel is not None:
+            cancel.wait(delay)
+        else:
+            time.sleep(delay)
+
+
+def _policy_document(policy_json: Dict) -> PolicyDocument:
+    statements = policy_json.get("Statement", [])
+    if not statements:
+        raise PolicyGenerationError("Generated policy document missing Statement entries.")
+    return PolicyDocument(
+        statement=statements,
+        version=policy_json.get("Version", "2012-10-17"),
+    )
 
 
 def generate_policy(
     request: PolicyGenerationRequest,
     client: Optional[boto3.client] = None,
-    poll_interval: int = 10,
+    poll_interval: int = 30,
     timeout_seconds: int = 1800,
 ) -> PolicyDocument:
     """Convenience wrapper to kick off and retrieve the policy document."""
@@ -115,10 +156,35 @@ def generate_policy(
     policy_json = wait_for_policy_json(
         job_id=job_id, client=client, poll_interval=poll_interval, timeout_seconds=timeout_seconds
     )
-    statements = policy_json.get("Statement", [])
-    if not statements:
-        raise PolicyGenerationError("Generated policy document missing Statement entries.")
-    return PolicyDocument(
-        statement=statements,
-        version=policy_json.get("Version", "2012-10-17"),
-    )
+    return _policy_document(policy_json)
+
+
+def generate_policy_async(
+    request: PolicyGenerationRequest,
+    executor: Executor,
+    client: Optional[boto3.client] = None,
+    poll_interval: int = 30,
+    timeout_seconds: int = 1800,
+    cancel: Optional[threading.Event] = None,
+) -> "Future[PolicyDocument]":
+    """
+    Start the generation job now and poll for it on the caller's `executor`.
+
+    Errors starting the job are raised here; polling errors surface from
+    the returned future's result(). Set `cancel` before shutting the
+    executor down so an in-flight wait does not hold it until the timeout.
+    """
+    client = client or _build_access_analyzer_client()
+    job_id = start_policy_generation(request, client=client)
+
+    def _wait() -> PolicyDocument:
+        policy_json = wait_for_policy_json(
+            job_id=job_id,
+            client=client,
+            poll_interval=poll_interval,
+            timeout_seconds=timeout_seconds,
+            cancel=cancel,
+        )
+        return _policy_document(policy_json)
+
+    return executor.submit(_wait)
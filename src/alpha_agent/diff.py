@@ -1,27 +1,83 @@
 from __future__ import annotations
 
+import itertools
 import json
-from typing import Iterable, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+from .aws import get_client
+from .cache import TTLCache
 from .collector import PolicyGenerationError
 from .models import PolicyDiff, PolicyDocument
 
 
-def _build_iam_client() -> boto3.client:
-    return boto3.client("iam")
+# Per-policy IAM reads are fanned out; the pool is sized to keep them on
+# warm connections.
+_POLICY_FETCH_WORKERS = 16
+_IAM_CONFIG = Config(max_pool_connections=32)
+
+# Managed policy documents, keyed by policy ARN:
+#   arn -> (default_version_id, statements)
+# AWS-managed policies are served from here until the TTL expires; any cached
+# entry, expired or not, is reused whenever get_policy reports the same
+# default version.
+_managed_policy_cache: TTLCache[str, Tuple[str, List[dict]]] = TTLCache(
+    maxsize=4096, ttl_seconds=900.0
+)
+
+
+def _build_iam_client(region: Optional[str] = None) -> boto3.client:
+    return get_client("iam", region, _IAM_CONFIG)
+
+
+def _load_document(document: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    # botocore usually decodes IAM policy documents already; accept both forms
+    return json.loads(document) if isinstance(document, str) else document
+
+
+def _document_statements(document: Union[str, Dict[str, Any]]) -> List[dict]:
+    stmts = _load_document(document).get("Statement", [])
+    if isinstance(stmts, dict):
+        stmts = [stmts]
+    return stmts
+
+
+def _fetch_inline_statements(client: boto3.client, role_name: str, policy_name: str) -> List[dict]:
+    policy = client.get_role_policy(RoleName=role_name, PolicyName=policy_name)
+    return _document_statements(policy["PolicyDocument"])
+
+
+def _fetch_managed_statements(client: boto3.client, policy_arn: str) -> List[dict]:
+    if ":iam::aws:policy/" in policy_arn:
+        fresh = _managed_policy_cache.get(policy_arn)
+        if fresh:
+            return fresh[1]
+
+    # Get latest version
+    p_desc = client.get_policy(PolicyArn=policy_arn)
+    v_id = p_desc["Policy"]["DefaultVersionId"]
+    cached = _managed_policy_cache.get_stale(policy_arn)
+    if cached and cached[0] == v_id:
+        statements = cached[1]
+    else:
+        p_ver = client.get_policy_version(PolicyArn=policy_arn, VersionId=v_id)
+        statements = _document_statements(p_ver["PolicyVersion"]["Document"])
+
+    _managed_policy_cache.set(policy_arn, (v_id, statements))
+    return statements
+
+
+def _statement_actions(statement: dict) -> Iterable[str]:
+    actions = statement.get("Action") or ()
+    return (actions,) if isinstance(actions, str) else actions
 
 
 def _normalize_actions(statements: Iterable[dict]) -> Set[str]:
-    actions: Set[str] = set()
-    for statement in statements:
-        statement_actions = statement.get("Action") or []
-        if isinstance(statement_actions, str):
-            statement_actions = [statement_actions]
-        actions.update(statement_actions)
-    return actions
+    return set(itertools.chain.from_iterable(map(_statement_actions, statements)))
 
 
 def compute_policy_diff(
@@ -30,11 +86,25 @@ def compute_policy_diff(
     """
     Produce a simple action-level diff between the existing and proposed policy.
     """
+    # Re-runs against an unchanged role commonly propose the baseline verbatim
+    if existing is not None and (
+        existing is proposed
+        or (
+            existing.version == proposed.version
+            and existing.statement == proposed.statement
+        )
+    ):
+        return PolicyDiff(
+            existing_policy=existing,
+            proposed_policy=proposed,
+            change_summary="No action-level changes detected",
+        )
+
     existing_actions = _normalize_actions(existing.statement) if existing else set()
     proposed_actions = _normalize_actions(proposed.statement)
 
-    added = sorted(proposed_actions - existing_actions)
-    removed = sorted(existing_actions - proposed_actions)
+    added = sorted(proposed_actions.difference(existing_actions))
+    removed = sorted(existing_actions.difference(proposed_actions))
 
     summary_parts: List[str] = []
     if added:
@@ -64,7 +134,7 @@ def fetch_inline_policy(
     Returns None when the policy is not present.
     """
     client = client or _build_iam_client()
-    role_name = role_arn.split("/")[-1]
+    role_name = role_arn.rpartition("/")[2]
     try:
         response = client.get_role_policy(RoleName=role_name, PolicyName=policy_name)
     except ClientError as err:
@@ -73,8 +143,13 @@ def fetch_inline_policy(
             return None
         raise PolicyGenerationError(f"Unable to read existing policy: {err}") from err
 
-    document = json.loads(response["PolicyDocument"])
-    return PolicyDocument.model_validate(document)
+    # IAM has already validated this document, so skip pydantic validation.
+    # Keep model_validate for anything that comes from user input.
+    document = _load_document(response["PolicyDocument"])
+    return PolicyDocument.model_construct(
+        version=document.get("Version", "2012-10-17"),
+        statement=_document_statements(document),
+    )
 
 
 def fetch_all_role_policies(
@@ -85,36 +160,43 @@ def fetch_all_role_policies(
     Fetch and aggregate all inline and managed policies for an IAM role.
     """
     client = client or _build_iam_client()
-    role_name = role_arn.split("/")[-1]
+    role_name = role_arn.rpartition("/")[2]
     all_statements = []
 
     try:
-        # 1. Inline policies
-        inline_policies = client.list_role_policies(RoleName=role_name)
-        for name in inline_policies.get("PolicyNames", []):
-            policy = client.get_role_policy(RoleName=role_name, PolicyName=name)
-            doc = json.loads(policy["PolicyDocument"])
-            stmts = doc.get("Statement", [])
-            if isinstance(stmts, dict): stmts = [stmts]
-            all_statements.extend(stmts)
-
-        # 2. Managed policies
-        managed_policies = client.list_attached_role_policies(RoleName=role_name)
-        for policy_ref in managed_policies.get("AttachedPolicies", []):
-            policy_arn = policy_ref["PolicyArn"]
-            # Get latest version
-            p_desc = client.get_policy(PolicyArn=policy_arn)
-            v_id = p_desc["Policy"]["DefaultVersionId"]
-            p_ver = client.get_policy_version(PolicyArn=policy_arn, VersionId=v_id)
-            doc = json.loads(p_ver["PolicyVersion"]["Document"])
-            stmts = doc.get("Statement", [])
-            if isinstance(stmts, dict): stmts = [stmts]
-            all_statements.extend(stmts)
+        # 1. List inline and managed policies
+        pagination = {"PageSize": 1000}
+        inline_names = [
+            name
+            for page in client.get_paginator("list_role_policies").paginate(
+                RoleName=role_name, PaginationConfig=pagination
+            )
+            for name in page.get("PolicyNames", [])
+        ]
+        managed_arns = [
+            policy_ref["PolicyArn"]
+            for page in client.get_paginator("list_attached_role_policies").paginate(
+                RoleName=role_name, PaginationConfig=pagination
+            )
+            for policy_ref in page.get("AttachedPolicies", [])
+        ]
+
+        # 2. Fetch every document concurrently (order is kept for stable output)
+        with ThreadPoolExecutor(max_workers=_POLICY_FETCH_WORKERS) as pool:
+            inline = pool.map(
+                lambda name: _fetch_inline_statements(client, role_name, name), inline_names
+            )
+            managed = pool.map(
+                lambda arn: _fetch_managed_statements(client, arn), managed_arns
+            )
+            for stmts in itertools.chain(inline, managed):
+                all_statements.extend(stmts)
 
     except ClientError as err:
         raise PolicyGenerationError(f"Unable to read role policies: {err}") from err
 
-    return PolicyDocument(
+    # Statements come straight from IAM; see fetch_inline_policy
+    return PolicyDocument.model_construct(
         version="2012-10-17",
         statement=all_statements
     )
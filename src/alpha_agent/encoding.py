@@ -0,0 +1,11 @@
+"""
+Shared JSON encoding for outbound request bodies.
+"""
+from __future__ import annotations
+
+import json
+
+# Compact separators: prompts are billed per token and request bodies go over
+# the wire, so whitespace is pure overhead. One reusable encoder also avoids
+# json.dumps building a new one whenever non-default options are passed.
+COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
@@ -4,9 +4,28 @@ import logging
 from typing import Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .encoding import COMPACT_JSON_ENCODER
 
 LOGGER = logging.getLogger(__name__)
 
+# Retry transient gateway errors. A gateway error can arrive after the PR was
+# created, in which case the retried POST gets a 422 "already exists";
+# create_pull_request resolves that to the existing PR.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST"}),
+    raise_on_status=False,
+)
+
+
+# GitHub's 422 validation message when head/base already has an open PR
+_PR_EXISTS_MESSAGE = "A pull request already exists"
+
 
 class GitHubError(RuntimeError):
     """Raised when interactions with the GitHub API fail."""
@@ -17,16 +36,26 @@ class GitHubClient:
     Lightweight GitHub REST API helper for creating pull requests.
     """
 
-    def __init__(self, token: str, api_url: str = "https://api.github.com") -> None:
+    def __init__(
+        self,
+        token: str,
+        api_url: str = "https://api.github.com",
+        session: Optional[requests.Session] = None,
+    ) -> None:
         self.api_url = api_url.rstrip("/")
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {token}",
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "alpha-agent/0.1.0",
-            }
-        )
+        # Credentials travel per request so a session shared with other
+        # services never carries the GitHub token.
+        self._headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "alpha-agent/0.1.0",
+            "Content-Type": "application/json",
+        }
+        self.session = session or requests.Session()
+        prefix = f"{self.api_url}/"
+        if prefix not in self.session.adapters:
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=_RETRY)
+            self.session.mount(prefix, adapter)
 
     def create_pull_request(
         self,
@@ -52,7 +81,18 @@ class GitHubClient:
             "base": base,
             "draft": draft,
         }
-        response = self.session.post(endpoint, json=payload, timeout=15)
+        # Compact separators keep multi-KB PR bodies small on the wire
+        response = self.session.post(
+            endpoint,
+            data=COMPACT_JSON_ENCODER.encode(payload).encode("utf-8"),
+            headers=self._headers,
+            timeout=15,
+        )
+        if response.status_code == 422 and _PR_EXISTS_MESSAGE in response.text:
+            existing = self._find_open_pull_request(owner_repo, head, base)
+            if existing is not None:
+                LOGGER.info("PR already exists: %s", existing.get("html_url"))
+                return existing
         if response.status_code >= 300:
             raise GitHubError(
                 f"GitHub PR creation failed ({response.status_code}): {response.text}"
@@ -60,3 +100,19 @@ class GitHubClient:
         pr = response.json()
         LOGGER.info("Created PR %s", pr.get("html_url"))
         return pr
+
+    def _find_open_pull_request(self, owner_repo: str, head: str, base: str) -> Optional[Dict]:
+        """Return the open PR for ``head`` into ``base``, if there is one."""
+        # The pulls filter wants head as owner:branch
+        if ":" not in head:
+            head = f"{owner_repo.split('/')[0]}:{head}"
+        response = self.session.get(
+            f"{self.api_url}/repos/{owner_repo}/pulls",
+            params={"head": head, "base": base, "state": "open"},
+            headers=self._headers,
+            timeout=15,
+        )
+        if response.status_code >= 300:
+            return None
+        pulls = response.json()
+        return pulls[0] if pulls else None
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 from typing import Dict, List, Tuple
 
 from .models import GuardrailViolation, PolicyDocument
@@ -9,6 +8,8 @@ WILDCARD_ACTION_VIOLATION = "WILDCARD_ACTION"
 MISSING_CONDITION_VIOLATION = "MISSING_CONDITION"
 UNSUPPORTED_SERVICE_VIOLATION = "UNSUPPORTED_SERVICE"
 
+_FULL_WILDCARDS = frozenset({"*", "*:*"})
+
 
 def _ensure_list(value):
     if isinstance(value, list):
@@ -28,14 +29,21 @@ def enforce_guardrails(
     Returns an updated policy document and any violations discovered so they can
     be surfaced to human reviewers.
     """
-    updated_policy = copy.deepcopy(policy).model_dump()
+    # model_dump builds fresh containers, so statements can be edited in place
+    updated_policy = policy.model_dump()
     violations: List[GuardrailViolation] = []
+    blocked = dict.fromkeys(blocked_actions)  # O(1) lookups, keeps reporting order
+    disallowed = frozenset(disallowed_services)
 
     for idx, statement in enumerate(updated_policy["statement"]):
         actions = _ensure_list(statement.get("Action", []))
         resources = _ensure_list(statement.get("Resource", []))
+        actions_set = set(actions)
 
-        if any(action == "*" or action.endswith(":*") for action in actions):
+        rewrite = False
+        dropped = set()
+        # "*" is a single set lookup; "*:*" is caught by the suffix test
+        if "*" in actions_set or any(action.endswith(":*") for action in actions_set):
             violations.append(
                 GuardrailViolation(
                     code=WILDCARD_ACTION_VIOLATION,
@@ -43,27 +51,30 @@ def enforce_guardrails(
                     path=f"statement[{idx}].Action",
                 )
             )
-            statement["Action"] = [
-                action for action in actions if action not in {"*", "*:*"}
-            ]
+            rewrite = True
+            dropped.update(actions_set & _FULL_WILDCARDS)
 
-        for blocked in blocked_actions:
-            if blocked in actions:
+        for action in blocked:
+            if action in actions_set:
                 violations.append(
                     GuardrailViolation(
                         code=WILDCARD_ACTION_VIOLATION,
-                        message=f"Action {blocked} is blocked by policy.",
+                        message=f"Action {action} is blocked by policy.",
                         path=f"statement[{idx}].Action",
                     )
                 )
-                statement["Action"] = [a for a in actions if a != blocked]
+                rewrite = True
+                dropped.add(action)
+
+        if rewrite:
+            statement["Action"] = [action for action in actions if action not in dropped]
 
-        services = {action.split(":")[0] for action in actions if ":" in action}
-        if disallowed_services and services & set(disallowed_services):
+        services = {action.split(":")[0] for action in actions_set if ":" in action}
+        if services & disallowed:
             violations.append(
                 GuardrailViolation(
                     code=UNSUPPORTED_SERVICE_VIOLATION,
-                    message=f"Service(s) {services & set(disallowed_services)} not allowed.",
+                    message=f"Service(s) {services & disallowed} not allowed.",
                     path=f"statement[{idx}]",
                 )
             )
@@ -84,7 +95,9 @@ def enforce_guardrails(
         if "*" in resources and len(resources) > 1:
             statement["Resource"] = [r for r in resources if r != "*"]
 
-    sanitized = PolicyDocument(
+    # Statements were dumped from a validated document and only filtered
+    # above, so there is nothing left for pydantic to check.
+    sanitized = PolicyDocument.model_construct(
         version=updated_policy.get("version", "2012-10-17"),
         statement=updated_policy["statement"],
     )
@@ -0,0 +1,27 @@
+"""
+Shared requests session for outbound HTTPS.
+
+Slack webhooks and the GitHub API are called from the same process, so one
+session keeps their TLS connections warm across calls instead of paying a
+handshake per request.
+"""
+from __future__ import annotations
+
+import functools
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+@functools.lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """Return the process-wide requests session."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    return session
@@ -1,12 +1,33 @@
 from __future__ import annotations
 
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
+class _Record:
+    """
+    Helpers for internal dataclass records.
+
+    Records that never cross a JSON boundary use slotted dataclasses
+    instead of pydantic models, skipping validation and per-instance
+    __dict__ allocation.
+    """
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+
 class Environment(str, Enum):
     SANDBOX = "sandbox"
     CANARY = "canary"
@@ -14,6 +35,8 @@ class Environment(str, Enum):
 
 
 class PolicyGenerationRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     analyzer_arn: str = Field(..., description="ARN of the IAM Access Analyzer.")
     resource_arn: str = Field(..., description="ARN of the IAM role to right-size.")
     cloudtrail_access_role_arn: str = Field(
@@ -33,27 +56,41 @@ class PolicyGenerationRequest(BaseModel):
 
 
 class PolicyDocument(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, alias_generator=None)
+    model_config = ConfigDict(
+        populate_by_name=True, alias_generator=None, frozen=True, defer_build=True
+    )
 
     version: str = Field("2012-10-17", alias="Version")
     statement: List[Dict[str, Any]] = Field(..., alias="Statement")
 
 
 class PolicyDiff(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     existing_policy: Optional[PolicyDocument] = None
     proposed_policy: PolicyDocument
     added_actions: List[str] = Field(default_factory=list)
     removed_actions: List[str] = Field(default_factory=list)
     change_summary: str = ""
 
+    @cached_property
+    def reduction_pct(self) -> float:
+        """Share of changed actions that are removals, as a percentage."""
+        removed = len(self.removed_actions)
+        return (removed / max(removed + len(self.added_actions), 1)) * 100
+
 
 class GuardrailViolation(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     code: str
     message: str
     path: Optional[str] = None
 
 
 class RiskSignal(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     probability_of_break: float = Field(
         0.0, description="0-1 range representing the likelihood of causing breakage."
     )
@@ -61,6 +98,8 @@ class RiskSignal(BaseModel):
 
 
 class PolicyProposal(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     proposed_policy: PolicyDocument
     rationale: str
     guardrail_violations: List[GuardrailViolation] = Field(default_factory=list)
@@ -68,7 +107,19 @@ class PolicyProposal(BaseModel):
     remediation_notes: List[str] = Field(default_factory=list)
 
 
-class ApprovalRecord(BaseModel):
+class ProposalEnvelope(BaseModel):
+    """Layout of the proposal file written by `alpha analyze --output`."""
+
+    model_config = ConfigDict(defer_build=True)
+
+    version: str = "1.0"
+    proposal: PolicyProposal
+    diff: Optional[PolicyDiff] = None
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ApprovalRecord(_Record):
     approver: str
     approved: bool
     timestamp: datetime
@@ -83,18 +134,22 @@ class RolloutStage(str, Enum):
 
 
 class RolloutPlan(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     stages: List[RolloutStage]
     pause_between_minutes: int = 5
 
 
-class RolloutOutcome(BaseModel):
+@dataclass(slots=True)
+class RolloutOutcome(_Record):
     stage: RolloutStage
     succeeded: bool
     error: Optional[str] = None
-    metrics: Dict[str, Any] = Field(default_factory=dict)
+    metrics: Dict[str, Any] = field(default_factory=dict)
 
 
-class NotificationPayload(BaseModel):
+@dataclass(slots=True)
+class NotificationPayload(_Record):
     channel: str
     message: str
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import json
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 
 import requests
 from requests import Response
 
+from .encoding import COMPACT_JSON_ENCODER
+from .http import get_session
 from .models import NotificationPayload
 
 LOGGER = logging.getLogger(__name__)
@@ -16,6 +17,37 @@ class NotificationError(RuntimeError):
     """Raised when outgoing notifications fail."""
 
 
+# Slack rejects messages with more than 50 blocks
+_SLACK_MAX_BLOCKS = 50
+
+
+def _payload_blocks(payload: NotificationPayload) -> List[dict]:
+    blocks = [
+        {"type": "section", "text": {"type": "mrkdwn", "text": payload.message}},
+    ]
+
+    if payload.metadata:
+        fields = [
+            {"type": "mrkdwn", "text": f"*{key}*\n{value}"}
+            for key, value in payload.metadata.items()
+        ]
+        blocks.append({"type": "section", "fields": fields})
+    return blocks
+
+
+def _post_message(session: requests.Session, webhook_url: str, message: Dict) -> Response:
+    response = session.post(
+        webhook_url,
+        data=COMPACT_JSON_ENCODER.encode(message).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    if response.status_code >= 400:
+        raise NotificationError(
+            f"Slack webhook failed with {response.status_code}: {response.text}"
+        )
+    return response
+
+
 def send_slack_webhook(
     webhook_url: str,
     payload: NotificationPayload,
@@ -26,24 +58,45 @@ def send_slack_webhook(
 
     The payload is serialized to a Slack Block Kit layout.
     """
-    session = session or requests.Session()
-    message = {
-        "text": payload.message,
-        "blocks": [
-            {"type": "section", "text": {"type": "mrkdwn", "text": payload.message}},
-        ],
-    }
-
-    if payload.metadata:
-        fields = []
-        for key, value in payload.metadata.items():
-            fields.append({"type": "mrkdwn", "text": f"*{key}*\n{value}"})
-        message["blocks"].append({"type": "section", "fields": fields})
-
-    response = session.post(webhook_url, data=json.dumps(message))
-    if response.status_code >= 400:
-        raise NotificationError(
-            f"Slack webhook failed with {response.status_code}: {response.text}"
-        )
+    session = session or get_session()
+    message = {"text": payload.message, "blocks": _payload_blocks(payload)}
+    response = _post_message(session, webhook_url, message)
     LOGGER.info("Slack notification sent to %s", payload.channel)
     return response
+
+
+def send_slack_batch(
+    webhook_url: str,
+    payloads: Sequence[NotificationPayload],
+    session: Optional[requests.Session] = None,
+) -> List[Response]:
+    """
+    Send several notifications as combined Block Kit messages.
+
+    Payloads are packed in order into as few POSTs as Slack's block limit
+    allows; a payload's blocks are never split across messages.
+    """
+    session = session or get_session()
+    responses: List[Response] = []
+    texts: List[str] = []
+    blocks: List[dict] = []
+
+    def _flush() -> None:
+        if blocks:
+            message = {"text": "\n".join(texts), "blocks": list(blocks)}
+            responses.append(_post_message(session, webhook_url, message))
+            texts.clear()
+            blocks.clear()
+
+    for payload in payloads:
+        payload_blocks = _payload_blocks(payload)
+        if len(blocks) + len(payload_blocks) > _SLACK_MAX_BLOCKS:
+            _flush()
+        texts.append(payload.message)
+        blocks.extend(payload_blocks)
+    _flush()
+
+    LOGGER.info(
+        "Sent %d Slack notifications in %d message(s)", len(payloads), len(responses)
+    )
+    return responses
@@ -1,17 +1,139 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
-import boto3
 from botocore.exceptions import ClientError
 
+from .aws import get_client
+from .cache import TTLCache
+from .encoding import COMPACT_JSON_ENCODER
 from .models import PolicyDocument, PolicyProposal, RiskSignal
 
+if TYPE_CHECKING:
+    import boto3
+
 LOGGER = logging.getLogger(__name__)
 
+# Raw model response bodies keyed by a hash of (model_id, request body).
+# Opt-in (BedrockReasoner(cache=True)) and only for low-temperature calls,
+# where identical input gives effectively identical output; entries expire
+# so long-lived processes still resample the model.
+_CACHEABLE_MAX_TEMPERATURE = 0.3
+_response_cache: TTLCache[str, bytes] = TTLCache(maxsize=128, ttl_seconds=600.0)
+
+# Static instructions, joined once; only the JSON payload varies per call
+_PROMPT_PREFIX = "\n".join([
+    "You are ALPHA, an IAM least-privilege expert embedded in a security engineering team.",
+    "You receive:",
+    "- The generated policy document based on actual usage.",
+    "- Context about the role, service ownership, and organizational constraints.",
+    "Respond with JSON containing:",
+    "policy // policy JSON that is safe to apply.",
+    "rationale // short paragraph summarizing the key changes.",
+    "risk_signal // object with probability_of_break (0-1) and rationale.",
+    "remediation_notes // list of action items for humans.",
+    "guardrail_violations // list of {code, message, path} for any violations found.",
+    "Only output JSON. Do not wrap in markdown.",
+]) + "\n"
+
+_ANTHROPIC_PREFIXES = ("anthropic.", "us.anthropic.")
+_NOVA_PREFIXES = ("amazon.nova", "us.amazon.nova", "eu.amazon.nova", "apac.amazon.nova")
+
+
+def _detect_provider(model_id: str) -> str:
+    """Map a Bedrock model id to the request schema it expects."""
+    if model_id.startswith(_ANTHROPIC_PREFIXES):
+        return "anthropic"
+    if model_id.startswith(_NOVA_PREFIXES):
+        return "nova"
+    return "titan"
+
+
+# Request bodies are fixed apart from the temperature and prompt slots, so
+# they are filled from templates rather than encoded from nested dicts.
+_ANTHROPIC_BODY_TEMPLATE = (
+    '{"anthropic_version":"bedrock-2023-05-31","max_tokens":2000,'
+    '"temperature":%s,'
+    '"messages":[{"role":"user","content":[{"type":"text","text":%s}]}]}'
+)
+# Nova text understanding – prefer messages + inferenceConfig schema
+_NOVA_BODY_TEMPLATE = (
+    '{"messages":[{"role":"user","content":[{"text":%s}]}],'
+    '"inferenceConfig":{"maxTokens":2000,"temperature":%s}}'
+)
+# Fallback to Titan-like schema
+_TITAN_BODY_TEMPLATE = (
+    '{"inputText":%s,'
+    '"textGenerationConfig":{"maxTokenCount":2000,"temperature":%s,"topP":0.9}}'
+)
+
+
+def _anthropic_body(prompt: str, temperature: float) -> str:
+    return _ANTHROPIC_BODY_TEMPLATE % (
+        COMPACT_JSON_ENCODER.encode(temperature),
+        COMPACT_JSON_ENCODER.encode(prompt),
+    )
+
+
+def _nova_body(prompt: str, temperature: float) -> str:
+    return _NOVA_BODY_TEMPLATE % (
+        COMPACT_JSON_ENCODER.encode(prompt),
+        COMPACT_JSON_ENCODER.encode(temperature),
+    )
+
+
+def _titan_body(prompt: str, temperature: float) -> str:
+    return _TITAN_BODY_TEMPLATE % (
+        COMPACT_JSON_ENCODER.encode(prompt),
+        COMPACT_JSON_ENCODER.encode(temperature),
+    )
+
+
+_BODY_BUILDERS = {
+    "anthropic": _anthropic_body,
+    "nova": _nova_body,
+    "titan": _titan_body,
+}
+
+
+def _anthropic_completion(body: Dict[str, Any]) -> str:
+    return body["content"][0]["text"]
+
+
+def _nova_completion(body: Dict[str, Any]) -> str:
+    return body["output"]["message"]["content"][0]["text"]
+
+
+def _titan_completion(body: Dict[str, Any]) -> str:
+    return body["results"][0]["outputText"]
+
+
+_COMPLETION_EXTRACTORS = {
+    "anthropic": _anthropic_completion,
+    "nova": _nova_completion,
+    "titan": _titan_completion,
+}
+
+
+def _fallback_completion(body: Any) -> Optional[str]:
+    """Try every known response layout; used when the provider's own is missing."""
+    if not isinstance(body, dict):
+        return None
+    for extract in _COMPLETION_EXTRACTORS.values():
+        try:
+            completion = extract(body)
+        except (KeyError, IndexError, TypeError):
+            continue
+        if completion and isinstance(completion, str):
+            return completion
+    output = body.get("output")
+    return body.get("completion") or (output.get("text") if isinstance(output, dict) else None)
+
 
 class BedrockReasoningError(RuntimeError):
     """Raised when Bedrock reasoning fails."""
@@ -27,112 +149,56 @@ class BedrockReasoner:
         model_id: Optional[str] = None,
         client: Optional[boto3.client] = None,
         temperature: float = 0.2,
+        cache: bool = False,
     ) -> None:
         # Allow override via env var
         self.model_id = model_id or os.getenv("ALPHA_BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-5-20250929-v1:0")
-        self.client = client or boto3.client("bedrock-runtime")
+        self.client = client or get_client("bedrock-runtime")
         self.temperature = temperature
+        self.cache = cache and temperature <= _CACHEABLE_MAX_TEMPERATURE
+        # Resolve the request schema once rather than on every call
+        self._provider = _detect_provider(self.model_id)
+        self._body_builder = _BODY_BUILDERS[self._provider]
+        self._extract_completion = _COMPLETION_EXTRACTORS[self._provider]
 
-    def _build_prompt(self, context: Dict[str, Any], generated_policy: PolicyDocument) -> str:
-        prompt_sections = [
-            "You are ALPHA, an IAM least-privilege expert embedded in a security engineering team.",
-            "You receive:",
-            "- The generated policy document based on actual usage.",
-            "- Context about the role, service ownership, and organizational constraints.",
-            "Respond with JSON containing:",
-            "policy // policy JSON that is safe to apply.",
-            "rationale // short paragraph summarizing the key changes.",
-            "risk_signal // object with probability_of_break (0-1) and rationale.",
-            "remediation_notes // list of action items for humans.",
-            "guardrail_violations // list of {code, message, path} for any violations found.",
-            "Only output JSON. Do not wrap in markdown.",
-        ]
-
+    def _build_prompt(
+        self,
+        context: Dict[str, Any],
+        generated_policy: Union[PolicyDocument, Dict[str, Any]],
+    ) -> str:
+        # Callers prompting repeatedly with one policy may pass its
+        # model_dump() once instead of re-dumping the model per call.
+        if isinstance(generated_policy, PolicyDocument):
+            generated_policy = generated_policy.model_dump()
         payload = {
             "context": context,
-            "generated_policy": generated_policy.model_dump(),
+            "generated_policy": generated_policy,
         }
-        prompt_sections.append(json.dumps(payload))
-        return "\n".join(prompt_sections)
+        return _PROMPT_PREFIX + COMPACT_JSON_ENCODER.encode(payload)
 
-    def propose_policy(
-        self,
-        context: Dict[str, Any],
-        generated_policy: PolicyDocument,
-    ) -> PolicyProposal:
-        prompt = self._build_prompt(context, generated_policy)
-        model_id = self.model_id
-        # Choose payload schema based on model provider
-        is_anthropic = model_id.startswith("anthropic.") or model_id.startswith("us.anthropic.")
-        is_nova = model_id.startswith("amazon.nova") or model_id.startswith("us.amazon.nova") or model_id.startswith("eu.amazon.nova") or model_id.startswith("apac.amazon.nova")
-        try:
-            if is_anthropic:
-                body = json.dumps(
-                    {
-                        "anthropic_version": "bedrock-2023-05-31",
-                        "max_tokens": 2000,
-                        "temperature": self.temperature,
-                        "messages": [
-                            {"role": "user", "content": [{"type": "text", "text": prompt}]}
-                        ],
-                    }
-                )
-            elif is_nova:
-                # Nova text understanding – prefer messages + inferenceConfig schema
-                body = json.dumps(
-                    {
-                        "messages": [
-                            {"role": "user", "content": [{"text": prompt}]}
-                        ],
-                        "inferenceConfig": {
-                            "maxTokens": 2000,
-                            "temperature": self.temperature,
-                        },
-                    }
-                )
-            else:
-                # Fallback to Titan-like schema
-                body = json.dumps(
-                    {
-                        "inputText": prompt,
-                        "textGenerationConfig": {
-                            "maxTokenCount": 2000,
-                            "temperature": self.temperature,
-                            "topP": 0.9,
-                        },
-                    }
-                )
-
-            response = self.client.invoke_model(modelId=model_id, body=body, accept="application/json", contentType="application/json")
-        except ClientError as err:
-            raise BedrockReasoningError(f"Bedrock invocation failed: {err}") from err
+    def _build_body(self, prompt: str) -> str:
+        return self._body_builder(prompt, self.temperature)
 
+    def _parse_response(self, raw: bytes) -> PolicyProposal:
         try:
-            body = json.loads(response["body"].read())
-            # Try Anthropic content first
-            completion: Optional[str] = None
-            if isinstance(body, dict):
-                try:
-                    completion = body["content"][0]["text"]
-                except Exception:
-                    # Try Nova-style keys
-                    completion = (
-                        body.get("completion")
-                        or body.get("output", {}).get("text")
-                        or body.get("results", [{}])[0].get("outputText")
-                    )
-            if (not completion or not isinstance(completion, str)) and isinstance(body, dict):
-                try:
-                    # Converse-style output
-                    completion = body.get("output", {}).get("message", {}).get("content", [{}])[0].get("text")
-                except Exception:
-                    completion = completion
+            body = json.loads(raw)
+            try:
+                completion = self._extract_completion(body)
+            except (KeyError, IndexError, TypeError):
+                completion = None
+            if not completion or not isinstance(completion, str):
+                LOGGER.warning(
+                    "Unexpected %s response shape from %s; trying other layouts",
+                    self._provider,
+                    self.model_id,
+                )
+                completion = _fallback_completion(body)
             if not completion or not isinstance(completion, str):
                 raise KeyError("No text completion found in response")
             proposal_payload = json.loads(completion)
         except (KeyError, json.JSONDecodeError) as err:
             raise BedrockReasoningError(
-                f"Unexpected response structure from model: {response}"
+                f"Unexpected response structure from model: {raw!r}"
             ) from err
 
         return PolicyProposal(
@@ -142,3 +208,50 @@ class BedrockReasoner:
             risk_signal=RiskSignal(**proposal_payload.get("risk_signal", {})),
             remediation_notes=proposal_payload.get("remediation_notes", []),
         )
+
+    def propose_policy(
+        self,
+        context: Dict[str, Any],
+        generated_policy: Union[PolicyDocument, Dict[str, Any]],
+    ) -> PolicyProposal:
+        prompt = self._build_prompt(context, generated_policy)
+        body = self._build_body(prompt)
+
+        cache_key = None
+        if self.cache:
+            cache_key = hashlib.blake2b(
+                f"{self.model_id}\0{body}".encode("utf-8"), digest_size=16
+            ).hexdigest()
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                LOGGER.debug("Bedrock response cache hit for %s", self.model_id)
+                return self._parse_response(cached)
+
+        try:
+            response = self.client.invoke_model(modelId=self.model_id, body=body, accept="application/json", contentType="application/json")
+            raw = response["body"].read()
+        except ClientError as err:
+            raise BedrockReasoningError(f"Bedrock invocation failed: {err}") from err
+
+        # Parse before caching so malformed responses are never reused
+        proposal = self._parse_response(raw)
+        if cache_key is not None:
+            _response_cache.set(cache_key, raw)
+        return proposal
+
+    def propose_policies_batch(
+        self,
+        items: Sequence[Tuple[Dict[str, Any], Union[PolicyDocument, Dict[str, Any]]]],
+        max_concurrency: int = 8,
+    ) -> List[PolicyProposal]:
+        """
+        Run propose_policy for many (context, generated_policy) pairs concurrently.
+
+        Results are returned in input order. The first failure is raised once
+        the in-flight calls have finished.
+        """
+        if not items:
+            return []
+        workers = min(max_concurrency, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda item: self.propose_policy(*item), items))
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-import json
 import logging
 import time
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
 
-import boto3
 from botocore.exceptions import ClientError
 
+from .aws import get_client
 from .models import PolicyDocument, RolloutOutcome, RolloutStage
 
+if TYPE_CHECKING:
+    import boto3
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -17,12 +19,12 @@ class RolloutError(RuntimeError):
     """Raised when rollout actions fail."""
 
 
-def _build_iam_client() -> boto3.client:
-    return boto3.client("iam")
+def _build_iam_client(region: Optional[str] = None) -> boto3.client:
+    return get_client("iam", region)
 
 
 def _role_name_from_arn(role_arn: str) -> str:
-    return role_arn.split("/")[-1]
+    return role_arn.rpartition("/")[2]
 
 
 def stage_policy_version(
@@ -30,21 +32,31 @@ def stage_policy_version(
     policy_document: PolicyDocument,
     description: str,
     client: Optional[boto3.client] = None,
+    prepared_document: Optional[Union[str, bytes]] = None,
 ) -> str:
     """
     Create a new inline policy document attached to the role.
 
+    `prepared_document` is the already-serialized policy JSON, for callers
+    that have encoded it for another purpose; it must match
+    `policy_document`.
+
     Returns the policy name for reference.
     """
     client = client or _build_iam_client()
     role_name = _role_name_from_arn(role_arn)
     policy_name = f"ALPHAManaged{int(time.time())}"
+    if prepared_document is None:
+        # pydantic-core writes the JSON directly, with no intermediate dict
+        prepared_document = policy_document.model_dump_json(by_alias=True)
+    elif isinstance(prepared_document, bytes):
+        prepared_document = prepared_document.decode("utf-8")
 
     try:
         client.put_role_policy(
             RoleName=role_name,
             PolicyName=policy_name,
-            PolicyDocument=json.dumps(policy_document.model_dump(by_alias=True)),
+            PolicyDocument=prepared_document,
         )
     except ClientError as err:
         raise RolloutError(f"Failed to stage policy for {role_name}: {err}") from err
@@ -66,34 +78,25 @@ def delete_staged_policy(
     LOGGER.info("Deleted staged policy %s from role %s", policy_name, role_name)
 
 
+# Maximum tolerated error rate per stage. Every stage must be listed, so a
+# new stage fails loudly instead of passing by default.
+_STAGE_THRESHOLDS: Dict[RolloutStage, float] = {
+    RolloutStage.DRY_RUN: float("inf"),
+    RolloutStage.SANDBOX: 0.05,
+    RolloutStage.CANARY: 0.02,
+    RolloutStage.TARGET: 0.01,
+}
+
+
 def evaluate_stage(stage: RolloutStage, metrics: Dict[str, float]) -> bool:
     """
     Simple heuristic: fail if error metrics exceed thresholds.
     """
-    error_rate = metrics.get("error_rate", 0)
-    if stage == RolloutStage.SANDBOX:
-        return error_rate < 0.05
-    if stage == RolloutStage.CANARY:
-        return error_rate < 0.02
-    if stage == RolloutStage.TARGET:
-        return error_rate < 0.01
-    return True
+    return metrics.get("error_rate", 0) < _STAGE_THRESHOLDS[stage]
 
 
-def orchestrate_rollout(
-    role_arn: str,
-    policy_document: PolicyDocument,
-    stage: RolloutStage,
-    metrics_collector,
-    description: str,
-) -> RolloutOutcome:
-    """
-    Attach policy for a given stage and evaluate success based on metrics.
-
-    `metrics_collector` should be a callable returning a dictionary of metrics for
-    the role (e.g., CloudWatch alarms, custom health signals).
-    """
-    policy_name = stage_policy_version(role_arn, policy_document, description)
+def _run_single_stage(stage: RolloutStage, metrics_collector) -> RolloutOutcome:
+    """Evaluate one stage against an already-staged policy."""
     try:
         metrics = metrics_collector()
         succeeded = evaluate_stage(stage, metrics)
@@ -105,5 +108,51 @@ def orchestrate_rollout(
         return RolloutOutcome(
             stage=stage, succeeded=False, error=str(err), metrics={}
         )
+
+
+def orchestrate_rollouts(
+    role_arn: str,
+    policy_document: PolicyDocument,
+    stages: Sequence[RolloutStage],
+    metrics_collector,
+    description: str,
+    prepared_document: Optional[Union[str, bytes]] = None,
+) -> List[RolloutOutcome]:
+    """
+    Attach the policy once and evaluate each stage in order.
+
+    Stops at the first failing stage. The staged policy is removed once at
+    the end, so a full sandbox -> canary -> target run costs one put and one
+    delete instead of one of each per stage.
+    """
+    policy_name = stage_policy_version(
+        role_arn, policy_document, description, prepared_document=prepared_document
+    )
+    outcomes: List[RolloutOutcome] = []
+    try:
+        for stage in stages:
+            outcome = _run_single_stage(stage, metrics_collector)
+            outcomes.append(outcome)
+            if not outcome.succeeded:
+                break
     finally:
         delete_staged_policy(role_arn, policy_name)
+    return outcomes
+
+
+def orchestrate_rollout(
+    role_arn: str,
+    policy_document: PolicyDocument,
+    stage: RolloutStage,
+    metrics_collector,
+    description: str,
+) -> RolloutOutcome:
+    """
+    Attach policy for a given stage and evaluate success based on metrics.
+
+    `metrics_collector` should be a callable returning a dictionary of metrics for
+    the role (e.g., CloudWatch alarms, custom health signals).
+    """
+    return orchestrate_rollouts(
+        role_arn, policy_document, [stage], metrics_collector, description
+    )[0]